@@ -1,3 +1,4 @@
+import numpy as np
 from PIL import Image
 import sys
 import os
@@ -7,19 +8,22 @@ def convert_to_txt(img_path, txt_path):
         # Open image and convert to grayscale
         img = Image.open(img_path).convert('L')
         width, height = img.size
-        pixels = list(img.getdata())
+        arr = np.asarray(img, dtype=np.uint8)
 
         print(f"Converting {img_path} ({width}x{height}) to {txt_path}...")
 
-        with open(txt_path, 'w') as f:
+        if txt_path.endswith('.npy'):
+            # Binary fast path: no header, shape is stored in the file
+            np.save(txt_path, arr)
+            print("Done!")
+            return
+
+        with open(txt_path, 'wb', buffering=1 << 22) as f:
             # Write header: Height Width Channels
-            f.write(f"{height} {width} 1\n")
+            f.write(f"{height} {width} 1\n".encode())
             
-            # Write pixels (space separated)
-            # Writing one row at a time for readability/performance
-            for i in range(0, len(pixels), width):
-                row = pixels[i:i+width]
-                f.write(" ".join(map(str, row)) + "\n")
+            # Write pixels (space separated), one image row per line
+            np.savetxt(f, arr, fmt='%d', delimiter=' ')
 
         print("Done!")
     except Exception as e:
@@ -29,32 +33,48 @@ def convert_to_img(txt_path, img_path):
     try:
         print(f"Converting {txt_path} to {img_path}...")
         
-        with open(txt_path, 'r') as f:
-            # Read header
-            header = f.readline().strip().split()
+        if txt_path.endswith('.npy'):
+            pixels = np.load(txt_path, mmap_mode='r')
+            img = Image.fromarray(np.asarray(pixels, dtype=np.uint8))
+            img.save(img_path)
+            print("Done!")
+            return
+        
+        with open(txt_path, 'rb') as f:
+            # Read header: raw bytes, int() parses them without decoding
+            header = f.readline().split()
             if not header:
                 print("Error: Empty file")
                 return
             
             if len(header) != 3:
-                print(f"Error: Invalid header format: {header}")
+                print(f"Error: Invalid header format: {b' '.join(header).decode(errors='replace')}")
                 return
                 
             height, width, channels = map(int, header)
             
-            # Read pixels
-            pixels = []
-            for line in f:
-                # Filter out empty strings from splitting multiple spaces
-                vals = [int(x) for x in line.strip().split()]
-                pixels.extend(vals)
+            # Read pixels straight from the handle, past the header, in
+            # blocks of ~4 MiB of text into one preallocated buffer
+            pixels = np.zeros(width * height, dtype=np.uint8)
+            count = 0
+            while True:
+                lines = f.readlines(1 << 22)
+                if not lines:
+                    break
+                # Flat token stream: rows may hold any number of values
+                block = np.fromstring(b"".join(lines).decode(), dtype=np.int32, sep=' ')
+                if block.size and (block.min() < 0 or block.max() > 255):
+                    print("Error: Pixel values must be in 0-255")
+                    return
+                end = min(count + block.size, pixels.size)
+                pixels[count:end] = block[:end - count]
+                count += block.size
         
-        if len(pixels) != width * height:
-            print(f"Warning: Expected {width*height} pixels, got {len(pixels)}")
+        if count != width * height:
+            print(f"Warning: Expected {width*height} pixels, got {count}")
             
         # Create image
-        img = Image.new('L', (width, height))
-        img.putdata(pixels)
+        img = Image.fromarray(pixels.reshape(height, width))
         img.save(img_path)
         print("Done!")
     except Exception as e:
@@ -65,6 +85,7 @@ if __name__ == "__main__":
         print("Usage:")
         print("  To text:  python3 convert_image.py to_txt input.png output.txt")
         print("  To image: python3 convert_image.py to_img input.txt output.png")
+        print("  Use a .npy file in place of the .txt for binary format")
         sys.exit(1)
         
     mode = sys.argv[1]
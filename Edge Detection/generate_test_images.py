@@ -4,60 +4,110 @@ Generate test images for Canny edge detection benchmarks.
 Creates grayscale images with edges (gradients, shapes, etc.)
 """
 
+import io
 import os
-import random
 import math
+import numpy as np
+
+# Module-level RNG, seeded for reproducible images
+_RNG = np.random.default_rng(42)
+
+try:
+    import numba  # optional: create_shapes_image(..., use_numba=True)
+except ImportError:
+    numba = None
+
+# Decimal text of every 8-bit value, so rows are formatted by table lookup
+_PIXEL_BYTES = [str(i).encode() for i in range(256)]
+
+def format_pixel_rows(pixels):
+    """Format a 2D pixel array as space-separated text rows (bytes).
+    uint8 arrays use the lookup table; other dtypes go through np.savetxt."""
+    if pixels.dtype != np.uint8:
+        buf = io.BytesIO()
+        np.savetxt(buf, pixels, fmt='%d')
+        return buf.getvalue()
+    return b"".join(b" ".join([_PIXEL_BYTES[v] for v in row]) + b"\n"
+                    for row in pixels.tolist())
+
+# Rows per block when generating/writing large images (~4 MiB of text at 8k width)
+BLOCK_ROWS = 512
+
+def write_pixel_rows(f, pixels):
+    """Write a 2D pixel array as text rows, BLOCK_ROWS rows at a time"""
+    for y in range(0, pixels.shape[0], BLOCK_ROWS):
+        f.write(format_pixel_rows(pixels[y:y + BLOCK_ROWS]))
+
+if numba is not None:
+    @numba.njit
+    def fill_rect(canvas, rx, ry, rw, rh, val):
+        """Fill an axis-aligned rectangle, clipped to the canvas"""
+        for y in range(ry, min(canvas.shape[0], ry + rh)):
+            for x in range(rx, min(canvas.shape[1], rx + rw)):
+                canvas[y, x] = val
+
+    @numba.njit
+    def fill_disk(canvas, cx, cy, r, val):
+        """Fill a disk of radius r centred at (cx, cy), clipped to the canvas"""
+        for y in range(max(0, cy - r), min(canvas.shape[0], cy + r + 1)):
+            for x in range(max(0, cx - r), min(canvas.shape[1], cx + r + 1)):
+                if (x - cx) ** 2 + (y - cy) ** 2 <= r ** 2:
+                    canvas[y, x] = val
 
 def create_gradient_image(h, w, filename):
     """Horizontal gradient - good for testing edge detection"""
     os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else ".", exist_ok=True)
     
-    with open(filename, 'w') as f:
-        f.write(f"{h} {w} 1\n")
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Horizontal gradient with some vertical stripes
-                val = int((x / w) * 255)
-                if x % 50 < 5:  # Add vertical edges
-                    val = 255 - val
-                row.append(str(val))
-            f.write(" ".join(row) + "\n")
+    # Horizontal gradient with some vertical stripes
+    x = np.arange(w)
+    row = (x / w * 255).astype(np.uint8)
+    row = np.where(x % 50 < 5, 255 - row, row)  # Add vertical edges
+    pixels = np.broadcast_to(row, (h, w))
+    
+    with open(filename, 'wb', buffering=1 << 22) as f:
+        f.write(f"{h} {w} 1\n".encode())
+        write_pixel_rows(f, pixels)
     
     print(f"Created {filename}: {w}x{h}")
 
-def create_shapes_image(h, w, filename):
-    """Image with geometric shapes - rectangles and circles"""
+def create_shapes_image(h, w, filename, use_numba=False):
+    """Image with geometric shapes - rectangles and circles.
+    use_numba=True draws them with the Numba kernels instead of NumPy."""
     os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else ".", exist_ok=True)
     
-    pixels = [[50 for _ in range(w)] for _ in range(h)]  # Dark background
+    if use_numba and numba is None:
+        raise ImportError("use_numba=True requires numba to be installed")
+    
+    pixels = np.full((h, w), 50, dtype=np.uint8)  # Dark background
     
     # Add some rectangles
     for _ in range(5):
-        rx = random.randint(0, w - 100)
-        ry = random.randint(0, h - 100)
-        rw = random.randint(30, 100)
-        rh = random.randint(30, 100)
-        val = random.randint(150, 250)
-        for y in range(ry, min(ry + rh, h)):
-            for x in range(rx, min(rx + rw, w)):
-                pixels[y][x] = val
+        rx = int(_RNG.integers(0, w - 99))
+        ry = int(_RNG.integers(0, h - 99))
+        rw = int(_RNG.integers(30, 101))
+        rh = int(_RNG.integers(30, 101))
+        val = int(_RNG.integers(150, 251))
+        if use_numba:
+            fill_rect(pixels, rx, ry, rw, rh, val)
+        else:
+            pixels[ry:ry + rh, rx:rx + rw] = val
     
     # Add some circles
+    ys, xs = np.ogrid[:h, :w]
     for _ in range(3):
-        cx = random.randint(50, w - 50)
-        cy = random.randint(50, h - 50)
-        r = random.randint(20, 50)
-        val = random.randint(150, 250)
-        for y in range(max(0, cy - r), min(h, cy + r + 1)):
-            for x in range(max(0, cx - r), min(w, cx + r + 1)):
-                if (x - cx) ** 2 + (y - cy) ** 2 <= r ** 2:
-                    pixels[y][x] = val
-    
-    with open(filename, 'w') as f:
-        f.write(f"{h} {w} 1\n")
-        for row in pixels:
-            f.write(" ".join(map(str, row)) + "\n")
+        cx = int(_RNG.integers(50, w - 49))
+        cy = int(_RNG.integers(50, h - 49))
+        r = int(_RNG.integers(20, 51))
+        val = int(_RNG.integers(150, 251))
+        if use_numba:
+            fill_disk(pixels, cx, cy, r, val)
+        else:
+            disk = (xs - cx) ** 2 + (ys - cy) ** 2 <= r ** 2
+            pixels[disk] = val
+    
+    with open(filename, 'wb', buffering=1 << 22) as f:
+        f.write(f"{h} {w} 1\n".encode())
+        write_pixel_rows(f, pixels)
     
     print(f"Created {filename}: {w}x{h}")
 
@@ -65,41 +115,45 @@ def create_checkerboard_image(h, w, filename, block_size=32):
     """Checkerboard pattern - lots of edges"""
     os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else ".", exist_ok=True)
     
-    with open(filename, 'w') as f:
-        f.write(f"{h} {w} 1\n")
-        for y in range(h):
-            row = []
-            for x in range(w):
-                bx = x // block_size
-                by = y // block_size
-                val = 200 if (bx + by) % 2 == 0 else 50
-                row.append(str(val))
-            f.write(" ".join(row) + "\n")
+    by = np.arange(h)[:, None] // block_size
+    bx = np.arange(w)[None, :] // block_size
+    pixels = np.where((bx + by) & 1, 50, 200).astype(np.uint8)
+    
+    with open(filename, 'wb', buffering=1 << 22) as f:
+        f.write(f"{h} {w} 1\n".encode())
+        write_pixel_rows(f, pixels)
     
     print(f"Created {filename}: {w}x{h}")
 
-def create_noisy_edges_image(h, w, filename):
+def create_noisy_edges_image(h, w, filename, seed=None):
     """Image with edges and some noise"""
     os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else ".", exist_ok=True)
     
-    with open(filename, 'w') as f:
-        f.write(f"{h} {w} 1\n")
-        for y in range(h):
-            row = []
-            for x in range(w):
-                # Base: horizontal bands
-                band = (y // 64) % 2
-                base = 180 if band == 0 else 60
-                
-                # Add vertical edges
-                if x % 100 < 10:
-                    base = 255 - base
-                
-                # Add noise
-                noise = random.randint(-20, 20)
-                val = max(0, min(255, base + noise))
-                row.append(str(val))
-            f.write(" ".join(row) + "\n")
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    
+    # Vertical edges are at the same columns in every row
+    edges = (np.arange(w) % 100) < 10
+    
+    with open(filename, 'wb', buffering=1 << 22) as f:
+        f.write(f"{h} {w} 1\n".encode())
+        
+        # Generate and write one block of rows at a time, so each block
+        # is formatted while still in cache and peak memory stays small
+        for y0 in range(0, h, BLOCK_ROWS):
+            y = np.arange(y0, min(h, y0 + BLOCK_ROWS))
+            
+            # Base: horizontal bands
+            bands = ((y // 64) & 1)[:, None]
+            base = np.where(bands, 60, 180).astype(np.int16).repeat(w, axis=1)
+            
+            # Add vertical edges
+            base[:, edges] = 255 - base[:, edges]
+            
+            # Add noise
+            base += rng.integers(-20, 21, base.shape, dtype=np.int16)
+            np.clip(base, 0, 255, out=base)
+            block = base.astype(np.uint8)
+            f.write(format_pixel_rows(block))
     
     print(f"Created {filename}: {w}x{h}")
 
@@ -1,6 +1,14 @@
 import numpy as np
 from PIL import Image
 
+def save_image_matrix_npy(arr, path):
+    """
+    Save a pixel matrix as a binary .npy file.
+    Shape (H, W) for grayscale or (H, W, 3) for RGB; no text header needed.
+    """
+    np.save(path, np.ascontiguousarray(arr, dtype=np.uint8))
+    print(f"Saved image matrix to {path}")
+
 def save_image_matrix(input_path, output_txt_path, grayscale=True):
     """
     Reads an image (JPG/PNG), optionally converts to grayscale,
@@ -10,36 +18,37 @@ def save_image_matrix(input_path, output_txt_path, grayscale=True):
 
     Grayscale: each row has W integers.
     RGB:      each row has 3*W integers (R G B R G B ...).
+
+    If output_txt_path ends in .npy the array is saved in binary form instead.
     """
     img = Image.open(input_path)
 
     if grayscale:
         img = img.convert("L")      # 1 channel
-        arr = np.array(img)         # (H, W)
+        arr = np.asarray(img)       # (H, W)
         H, W = arr.shape
         C = 1
     else:
         img = img.convert("RGB")    # 3 channels
-        arr = np.array(img)         # (H, W, 3)
+        arr = np.asarray(img)       # (H, W, 3), channels innermost
         H, W, C = arr.shape
 
-    with open(output_txt_path, "w") as f:
+    if output_txt_path.endswith(".npy"):
+        save_image_matrix_npy(arr, output_txt_path)
+        return
+
+    with open(output_txt_path, "wb", buffering=1 << 22) as f:
         # Header line
-        f.write(f"{H} {W} {C}\n")
+        f.write(f"{H} {W} {C}\n".encode())
 
         if C == 1:
             # Each row: W grayscale values
-            for y in range(H):
-                row = " ".join(str(int(v)) for v in arr[y])
-                f.write(row + "\n")
+            np.savetxt(f, arr, fmt="%d", delimiter=" ")
         else:
-            # Each row: R G B R G B ... (3*W ints)
-            for y in range(H):
-                row_vals = []
-                for x in range(W):
-                    r, g, b = arr[y, x]
-                    row_vals.extend([int(r), int(g), int(b)])
-                f.write(" ".join(map(str, row_vals)) + "\n")
+            # Each row: R G B R G B ... (3*W ints).
+            # arr is C-contiguous, so this reshape is a view, not a copy.
+            rows = arr.reshape(H, 3 * W)
+            np.savetxt(f, rows, fmt="%d", delimiter=" ")
 
     print(f"Saved image matrix with header to {output_txt_path}")
 
@@ -4,21 +4,30 @@ Generate large test images for scaling experiments.
 """
 
 import os
-import random
+import numpy as np
+
+from generate_test_images import write_pixel_rows
+
+# Module-level RNG, seeded for reproducible images
+_RNG = np.random.default_rng(42)
 
 def create_bimodal_image(h, w, filename):
     """Create bimodal intensity distribution (good for Otsu)"""
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
-    with open(filename, 'w') as f:
-        f.write(f"{h} {w} 1\n")
-        for i in range(h * w):
+    # Generate and write blocks of ~1M pixels as H rows of W values,
+    # so only one block of pixels is ever held in memory
+    block_rows = max(1, (1 << 20) // w)
+    with open(filename, 'wb', buffering=1 << 22) as f:
+        f.write(f"{h} {w} 1\n".encode())
+        for y in range(0, h, block_rows):
+            shape = (min(block_rows, h - y), w)
             # 50% dark (20-80), 50% bright (180-240)
-            if random.random() < 0.5:
-                val = random.randint(20, 80)
-            else:
-                val = random.randint(180, 240)
-            f.write(f"{val}\n")
+            pick = _RNG.random(shape) < 0.5
+            vals = np.where(pick,
+                            _RNG.integers(20, 81, shape, dtype=np.uint8),
+                            _RNG.integers(180, 241, shape, dtype=np.uint8))
+            write_pixel_rows(f, vals)
     
     print(f"Created {filename}: {w}x{h} ({h*w:,} pixels)")
 
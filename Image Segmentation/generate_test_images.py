@@ -14,16 +14,44 @@ Test Cases:
 """
 
 import numpy as np
+import io
 import os
 
+# Module-level RNG, seeded for reproducible images
+_RNG = np.random.default_rng(42)
+
+# Decimal text of every 8-bit value, so rows are formatted by table lookup
+_PIXEL_BYTES = [str(i).encode() for i in range(256)]
+
+def format_pixel_rows(pixels):
+    """Format a 2D pixel array as space-separated text rows (bytes).
+    uint8 arrays use the lookup table; other dtypes go through np.savetxt."""
+    if pixels.dtype != np.uint8:
+        buf = io.BytesIO()
+        np.savetxt(buf, pixels, fmt='%d')
+        return buf.getvalue()
+    return b"".join(b" ".join([_PIXEL_BYTES[v] for v in row]) + b"\n"
+                    for row in pixels.tolist())
+
+# Rows per block when generating/writing large images (~4 MiB of text at 8k width)
+BLOCK_ROWS = 512
+
+def write_pixel_rows(f, pixels):
+    """Write a 2D pixel array as text rows, BLOCK_ROWS rows at a time"""
+    for y in range(0, pixels.shape[0], BLOCK_ROWS):
+        f.write(format_pixel_rows(pixels[y:y + BLOCK_ROWS]))
+
 def save_image_txt(arr, filename):
-    """Save numpy array as text format: H W C followed by pixel data."""
+    """Save numpy array as text format: H W C followed by pixel data.
+    Filenames ending in .npy are written as binary .npy instead."""
     H, W = arr.shape
-    with open(filename, 'w') as f:
-        f.write(f"{H} {W} 1\n")
-        for y in range(H):
-            row = ' '.join(str(int(v)) for v in arr[y])
-            f.write(row + '\n')
+    if filename.endswith('.npy'):
+        np.save(filename, arr)
+        print(f"Created: {filename} ({W}x{H}, {W*H:,} pixels)")
+        return
+    with open(filename, 'wb', buffering=1 << 22) as f:
+        f.write(f"{H} {W} 1\n".encode())
+        write_pixel_rows(f, arr)
     print(f"Created: {filename} ({W}x{H}, {W*H:,} pixels)")
 
 def generate_bimodal_image(width=256, height=256, bg_val=50, fg_val=200):
@@ -46,10 +74,8 @@ def generate_circle_image(width=256, height=256, bg_val=30, fg_val=220):
     cy, cx = height // 2, width // 2
     radius = min(width, height) // 3
     
-    for y in range(height):
-        for x in range(width):
-            if (x - cx)**2 + (y - cy)**2 <= radius**2:
-                img[y, x] = fg_val
+    ys, xs = np.ogrid[:height, :width]
+    img[(xs - cx)**2 + (ys - cy)**2 <= radius**2] = fg_val
     return img
 
 def generate_gradient_image(width=256, height=256):
@@ -58,9 +84,8 @@ def generate_gradient_image(width=256, height=256):
     Tests threshold at various intensity levels.
     Expected Otsu threshold: ~127 (midpoint)
     """
-    img = np.zeros((height, width), dtype=np.uint8)
-    for x in range(width):
-        img[:, x] = int(255 * x / (width - 1))
+    row = (np.arange(width) * 255 // (width - 1)).astype(np.uint8)
+    img = np.broadcast_to(row, (height, width)).copy()
     return img
 
 def generate_checkerboard_image(width=256, height=256, block_size=32, 
@@ -69,15 +94,10 @@ def generate_checkerboard_image(width=256, height=256, block_size=32,
     Create checkerboard pattern.
     Expected Otsu threshold: ~127 (equal areas of dark/bright)
     """
-    img = np.zeros((height, width), dtype=np.uint8)
-    for y in range(height):
-        for x in range(width):
-            block_y = y // block_size
-            block_x = x // block_size
-            if (block_x + block_y) % 2 == 0:
-                img[y, x] = dark
-            else:
-                img[y, x] = bright
+    block_y = np.arange(height)[:, None] // block_size
+    block_x = np.arange(width)[None, :] // block_size
+    odd = (block_x + block_y) & 1
+    img = np.where(odd, bright, dark).astype(np.uint8)
     return img
 
 def generate_noisy_bimodal_image(width=256, height=256, 
@@ -86,16 +106,16 @@ def generate_noisy_bimodal_image(width=256, height=256,
     Create bimodal image with Gaussian noise.
     Tests robustness of Otsu's method.
     """
-    np.random.seed(42)  # Reproducible
     img = np.zeros((height, width), dtype=np.float32)
     
     # Background (left half) with noise
-    img[:, :width//2] = bg_mean + np.random.normal(0, noise_std, (height, width//2))
+    img[:, :width//2] = bg_mean + _RNG.normal(0, noise_std, (height, width//2))
     
     # Foreground (right half) with noise  
-    img[:, width//2:] = fg_mean + np.random.normal(0, noise_std, (height, width - width//2))
+    img[:, width//2:] = fg_mean + _RNG.normal(0, noise_std, (height, width - width//2))
     
-    img = np.clip(img, 0, 255).astype(np.uint8)
+    np.clip(img, 0, 255, out=img)
+    img = img.astype(np.uint8)
     return img
 
 def generate_three_level_image(width=256, height=256):
@@ -118,7 +138,6 @@ def generate_large_test_image(width=1024, height=1024):
     Generate larger image for performance testing.
     Mixed content: gradient, solid regions, noise.
     """
-    np.random.seed(123)
     img = np.zeros((height, width), dtype=np.uint8)
     
     # Quadrant 1 (top-left): Gradient
@@ -132,9 +151,9 @@ def generate_large_test_image(width=1024, height=1024):
     img[height//2:, :width//2] = 50
     
     # Quadrant 4 (bottom-right): Random noise
-    img[height//2:, width//2:] = np.random.randint(0, 256, 
-                                                    (height - height//2, width - width//2),
-                                                    dtype=np.uint8)
+    img[height//2:, width//2:] = _RNG.integers(0, 256,
+                                                (height - height//2, width - width//2),
+                                                dtype=np.uint8)
     return img
 
 def generate_very_large_image(width=4096, height=4096):
@@ -144,18 +163,17 @@ def generate_very_large_image(width=4096, height=4096):
     """
     print(f"  Generating {width}x{height} image ({width*height:,} pixels)...")
     
-    np.random.seed(42)
-    
     # Bimodal with noise for realistic testing
     img = np.zeros((height, width), dtype=np.float32)
     
     # Top half: dark background with noise
-    img[:height//2, :] = np.random.normal(60, 30, (height//2, width))
+    img[:height//2, :] = _RNG.normal(60, 30, (height//2, width))
     
     # Bottom half: bright foreground with noise
-    img[height//2:, :] = np.random.normal(180, 30, (height - height//2, width))
+    img[height//2:, :] = _RNG.normal(180, 30, (height - height//2, width))
     
-    img = np.clip(img, 0, 255).astype(np.uint8)
+    np.clip(img, 0, 255, out=img)
+    img = img.astype(np.uint8)
     return img
 
 
@@ -5,6 +5,29 @@ import os
 import sys
 import glob
 
+# Longest side (px) each image is scaled to in the all-outputs overview, the
+# gap between overview cells, and the light-grey fill behind them
+TILE_SIZE = 512
+TILE_PAD = 16
+TILE_BG = 230
+
+def load_segmented_image_npy(npy_path):
+    """
+    Load image from a binary .npy file of shape (H, W) or (H, W, 3).
+    The file is memory-mapped rather than read up front.
+    Returns (img_array, C)
+    """
+    img = np.load(npy_path, mmap_mode="r")
+
+    if img.ndim == 2:
+        C = 1
+    elif img.ndim == 3 and img.shape[2] == 3:
+        C = 3
+    else:
+        raise ValueError(f"Unsupported array shape: {img.shape}")
+
+    return img, C
+
 def load_segmented_image(txt_path):
     """
     Load image from text file format:
@@ -12,19 +35,23 @@ def load_segmented_image(txt_path):
       Remaining: pixel values
         - C=1: H lines, each W ints
         - C=3: H lines, each 3*W ints (R G B ...)
+    Paths ending in .npy are loaded with load_segmented_image_npy.
     Returns (img_array, C)
     """
-    with open(txt_path, "r") as f:
-        header = f.readline().strip()
-        if not header:
+    if txt_path.endswith(".npy"):
+        return load_segmented_image_npy(txt_path)
+
+    with open(txt_path, "rb") as f:
+        # Header stays as bytes; int() parses it without decoding
+        parts = f.readline().split()
+        if not parts:
             raise ValueError("Empty file or missing header")
-        parts = header.split()
         if len(parts) != 3:
             raise ValueError("Header must have 3 integers: H W C")
         H, W, C = map(int, parts)
 
-    # Load remaining data as 2D array
-    data = np.loadtxt(txt_path, dtype=np.uint8, skiprows=1)
+        # Load remaining data as 2D array from the same handle
+        data = np.loadtxt(f, dtype=np.uint8)
 
     # Flatten then reshape according to header
     flat = data.reshape(-1)
@@ -112,40 +139,59 @@ def visualize_all_outputs(output_dir="output", save_dir="visualizations"):
     
     print(f"Found {len(txt_files)} output files")
     
-    # Create grid visualization
-    n = len(txt_files)
-    cols = min(4, n)
-    rows = (n + cols - 1) // cols
-    
-    fig, axes = plt.subplots(rows, cols, figsize=(4*cols, 4*rows))
-    if n == 1:
-        axes = np.array([axes])
-    axes = axes.flatten()
-    
-    for i, txt_file in enumerate(sorted(txt_files)):
+    # Load everything first; individual PNGs go straight through PIL
+    tiles = []
+    for txt_file in sorted(txt_files):
+        basename = os.path.basename(txt_file).replace('.txt', '')
         try:
             img, c = load_segmented_image(txt_file)
-            basename = os.path.basename(txt_file).replace('.txt', '')
-            
-            if c == 1:
-                axes[i].imshow(img, cmap="gray", vmin=0, vmax=255)
-            else:
-                axes[i].imshow(img)
-            axes[i].set_title(basename, fontsize=8)
-            axes[i].axis("off")
             
             # Save individual PNG
             png_path = os.path.join(save_dir, f"{basename}.png")
             Image.fromarray(img, mode="L" if c == 1 else "RGB").save(png_path)
             
+            # Nearest-neighbour resize so the longest side is TILE_SIZE px,
+            # keeping the aspect ratio
+            h, w = img.shape[:2]
+            side = max(h, w)
+            ys = np.linspace(0, h - 1, max(1, round(h * TILE_SIZE / side))).astype(int)
+            xs = np.linspace(0, w - 1, max(1, round(w * TILE_SIZE / side))).astype(int)
+            img = img[ys][:, xs]
+            if c == 1:
+                img = np.repeat(img[:, :, None], 3, axis=2)
+            tiles.append((basename, img))
+            
         except Exception as e:
             print(f"Error loading {txt_file}: {e}")
-            axes[i].text(0.5, 0.5, "Error", ha='center', va='center')
-            axes[i].axis("off")
+            tiles.append((basename, None))
     
-    # Hide unused subplots
-    for i in range(n, len(axes)):
-        axes[i].axis("off")
+    # Create grid visualization as one padded RGB canvas
+    n = len(tiles)
+    cols = min(4, n)
+    rows = (n + cols - 1) // cols
+    
+    loaded = [img for _, img in tiles if img is not None]
+    cell_h = max((img.shape[0] for img in loaded), default=1) + TILE_PAD
+    cell_w = max((img.shape[1] for img in loaded), default=1) + TILE_PAD
+    
+    canvas = np.full((rows * cell_h, cols * cell_w, 3), TILE_BG, dtype=np.uint8)
+    
+    plt.figure(figsize=(4*cols, 4*rows))
+    for i, (basename, img) in enumerate(tiles):
+        y0 = (i // cols) * cell_h
+        x0 = (i % cols) * cell_w
+        if img is None:
+            top = y0 + TILE_PAD
+            plt.text(x0 + cell_w / 2, y0 + cell_h / 2, "Error", ha='center', va='center')
+        else:
+            # Centre the tile in its cell so the label sits over it
+            top = y0 + (cell_h - img.shape[0]) // 2
+            left = x0 + (cell_w - img.shape[1]) // 2
+            canvas[top:top + img.shape[0], left:left + img.shape[1]] = img
+        plt.text(x0 + cell_w / 2, top, basename, ha='center', va='bottom', fontsize=8)
+    
+    plt.imshow(canvas)
+    plt.axis("off")
     
     plt.tight_layout()
     overview_path = os.path.join(save_dir, "all_outputs.png")